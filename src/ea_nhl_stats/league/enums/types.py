@@ -13,7 +13,7 @@ Example:
         >>> is_gm = role == ManagerRole.GM
 """
 
-from enum import Enum, auto
+from enum import Enum, auto, unique
 
 
 class ManagerRole(Enum):
@@ -38,8 +38,14 @@ class ManagerRole(Enum):
     PAID_AGM = "paid_agm"  # Paid Assistant GM 
 
 
-class Position(Enum):
-    """Player positions."""
+@unique
+class Position(int, Enum):
+    """Player positions.
+    
+    Note:
+        The int mixin makes members hash and compare as their int values,
+        the same way LeagueLevel and TeamIdentifier use str.
+    """
     CENTER = auto()
     LEFT_WING = auto()
     RIGHT_WING = auto()
@@ -49,6 +49,7 @@ class TeamFactory:
         Raises:
             ValueError: If no implementation exists for the identifier
         """
-        if identifier not in cls._teams:
+        team_class = cls._teams.get(identifier)
+        if team_class is None:
             raise ValueError(f"No implementation for team: {identifier}")
-        return cls._teams[identifier](**kwargs) 
\ No newline at end of file
+        return team_class(**kwargs) 
\ No newline at end of file
@@ -107,11 +107,12 @@ class LeaguePlayer(BaseModel):
             Stats are added to the team's stats even if it's not the player's current team.
         """
         # Initialize team stats if needed
-        if team_id not in self.team_stats:
-            self.team_stats[team_id] = PlayerStats()
+        team_stats = self.team_stats.get(team_id)
+        if team_stats is None:
+            team_stats = PlayerStats()
+            self.team_stats[team_id] = team_stats
             
         # Add game stats
-        team_stats = self.team_stats[team_id]
         team_stats.games_played += 1
         team_stats.game_stats[match_id] = stats
         team_stats.positions.add(self.position)  # Track position played
@@ -199,11 +199,13 @@ class ClubData(BaseModel):
             data: Dictionary of club data
             
         Returns:
-            Dictionary with converted integer values
+            New dictionary with converted integer values; the input is not
+            modified
             
         Raises:
             ValueError: If value cannot be converted to integer
         """
+        data = dict(data)
         string_fields = {
             "name",
             "clubname",
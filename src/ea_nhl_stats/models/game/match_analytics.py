@@ -54,6 +54,21 @@ class MomentumMetrics:
     scoring_chances_differential: int
 
 
+def _percentage(numerator: int, denominator: int, default: float = 0.0) -> float:
+    """
+    Express a count as a percentage of a total.
+    
+    Args:
+        numerator: The count being measured
+        denominator: The total it is measured against
+        default: Value returned when the total is not positive
+        
+    Returns:
+        numerator / denominator * 100, or default
+    """
+    return numerator / denominator * 100 if denominator > 0 else default
+
+
 class MatchAnalytics:
     """
     Analytics service for a single match.
@@ -86,13 +101,13 @@ class MatchAnalytics:
         if not all([home_agg, away_agg, home_club, away_club]):
             return None
             
-        total_possession = float(home_agg.skpossession + away_agg.skpossession)
+        total_possession = home_agg.skpossession + away_agg.skpossession
         
         return PossessionMetrics(
             possession_differential=float(home_agg.skpossession - away_agg.skpossession),
-            possession_percentage_home=(float(home_agg.skpossession) / total_possession * 100) if total_possession > 0 else 50.0,
-            possession_percentage_away=(float(away_agg.skpossession) / total_possession * 100) if total_possession > 0 else 50.0,
-            time_on_attack_differential=float(home_club.time_on_attack) - float(away_club.time_on_attack)
+            possession_percentage_home=_percentage(home_agg.skpossession, total_possession, 50.0),
+            possession_percentage_away=_percentage(away_agg.skpossession, total_possession, 50.0),
+            time_on_attack_differential=float(home_club.time_on_attack - away_club.time_on_attack)
         )
 
     def get_efficiency_metrics(self) -> Optional[EfficiencyMetrics]:
@@ -109,16 +124,12 @@ class MatchAnalytics:
             return None
             
         return EfficiencyMetrics(
-            home_shooting_efficiency=(float(home_club.goals) / float(home_club.shots) * 100) 
-                if float(home_club.shots) > 0 else 0.0,
-            away_shooting_efficiency=(float(away_club.goals) / float(away_club.shots) * 100)
-                if float(away_club.shots) > 0 else 0.0,
-            home_passing_efficiency=(float(home_club.passes_completed) / float(home_club.passes_attempted) * 100)
-                if float(home_club.passes_attempted) > 0 else 0.0,
-            away_passing_efficiency=(float(away_club.passes_completed) / float(away_club.passes_attempted) * 100)
-                if float(away_club.passes_attempted) > 0 else 0.0,
-            home_possession_efficiency=(float(home_club.time_on_attack) / 3600 * 100),  # Convert to percentage of game
-            away_possession_efficiency=(float(away_club.time_on_attack) / 3600 * 100)
+            home_shooting_efficiency=_percentage(home_club.goals, home_club.shots),
+            away_shooting_efficiency=_percentage(away_club.goals, away_club.shots),
+            home_passing_efficiency=_percentage(home_club.passes_completed, home_club.passes_attempted),
+            away_passing_efficiency=_percentage(away_club.passes_completed, away_club.passes_attempted),
+            home_possession_efficiency=_percentage(home_club.time_on_attack, 3600),  # Percentage of game
+            away_possession_efficiency=_percentage(away_club.time_on_attack, 3600)
         )
 
     def get_special_teams_metrics(self) -> Optional[SpecialTeamsMetrics]:
@@ -135,14 +146,12 @@ class MatchAnalytics:
             return None
             
         return SpecialTeamsMetrics(
-            home_powerplay_pct=(float(home_club.powerplay_goals) / float(home_club.powerplay_opportunities) * 100)
-                if float(home_club.powerplay_opportunities) > 0 else 0.0,
-            away_powerplay_pct=(float(away_club.powerplay_goals) / float(away_club.powerplay_opportunities) * 100)
-                if float(away_club.powerplay_opportunities) > 0 else 0.0,
-            home_penalty_kill_pct=(1 - float(away_club.powerplay_goals) / float(away_club.powerplay_opportunities)) * 100
-                if float(away_club.powerplay_opportunities) > 0 else 100.0,
-            away_penalty_kill_pct=(1 - float(home_club.powerplay_goals) / float(home_club.powerplay_opportunities)) * 100
-                if float(home_club.powerplay_opportunities) > 0 else 100.0
+            home_powerplay_pct=_percentage(home_club.powerplay_goals, home_club.powerplay_opportunities),
+            away_powerplay_pct=_percentage(away_club.powerplay_goals, away_club.powerplay_opportunities),
+            home_penalty_kill_pct=(1 - away_club.powerplay_goals / away_club.powerplay_opportunities) * 100
+                if away_club.powerplay_opportunities > 0 else 100.0,
+            away_penalty_kill_pct=(1 - home_club.powerplay_goals / home_club.powerplay_opportunities) * 100
+                if home_club.powerplay_opportunities > 0 else 100.0
         )
 
     def get_momentum_metrics(self) -> Optional[MomentumMetrics]:
@@ -176,8 +185,8 @@ class MatchAnalytics:
         )
         
         return MomentumMetrics(
-            home_score=max(0, momentum_score),
-            away_score=max(0, -momentum_score),
+            home_score=max(0.0, momentum_score),
+            away_score=max(0.0, -momentum_score),
             shot_differential=shot_diff,
             hit_differential=hit_diff,
             takeaway_differential=takeaway_diff,
@@ -1,3 +1,6 @@
+from typing import ClassVar, FrozenSet
+
+
 class MatchTypeValidator:
     """Validates game match type identifiers.
     
@@ -5,6 +8,10 @@ class MatchTypeValidator:
     validation functionality.
     """
     
+    VALID_MATCH_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {"gameType5", "gameType10", "club_private"}
+    )
+    
     def validate(self, match_type: str) -> bool:
         """Validates if the given match type is supported.
         
@@ -14,5 +21,4 @@ class MatchTypeValidator:
         Returns:
             bool: True if the match type is valid, False otherwise.
         """
-        valid_match_types = ["gameType5", "gameType10", "club_private"]
-        return match_type in valid_match_types 
\ No newline at end of file
+        return match_type in self.VALID_MATCH_TYPES 
\ No newline at end of file
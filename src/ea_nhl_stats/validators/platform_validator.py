@@ -1,5 +1,8 @@
 """Platform validation for EA NHL stats."""
 
+from typing import ClassVar, FrozenSet
+
+
 class PlatformValidator:
     """Validates gaming platform identifiers.
     
@@ -7,6 +10,10 @@ class PlatformValidator:
     validation functionality.
     """
     
+    VALID_PLATFORMS: ClassVar[FrozenSet[str]] = frozenset(
+        {"ps5", "ps4", "xbox-series-xs", "xboxone", "common-gen5"}
+    )
+    
     def validate(self, platform: str) -> bool:
         """Validates if the given platform is supported.
         
@@ -16,5 +23,4 @@ class PlatformValidator:
         Returns:
             bool: True if the platform is valid, False otherwise.
         """
-        valid_platforms = ["ps5", "ps4", "xbox-series-xs", "xboxone", "common-gen5"]
-        return platform in valid_platforms 
\ No newline at end of file
+        return platform in self.VALID_PLATFORMS 
\ No newline at end of file
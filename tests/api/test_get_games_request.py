@@ -15,19 +15,19 @@ if TYPE_CHECKING:
     from _pytest.monkeypatch import MonkeyPatch
     from pytest_mock.plugin import MockerFixture
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def web_request() -> WebRequest:
-    """Fixture providing a WebRequest instance."""
+    """Fixture providing a WebRequest instance shared across the module."""
     return WebRequest()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def platform_validator() -> PlatformValidator:
-    """Fixture providing a PlatformValidator instance."""
+    """Fixture providing a PlatformValidator instance shared across the module."""
     return PlatformValidator()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def match_type_validator() -> MatchTypeValidator:
-    """Fixture providing a MatchTypeValidator instance."""
+    """Fixture providing a MatchTypeValidator instance shared across the module."""
     return MatchTypeValidator()
 
 def test_get_games_request_initialization(
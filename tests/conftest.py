@@ -1,12 +1,24 @@
 """Shared pytest fixtures for testing."""
 
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 from pathlib import Path
 import os
 import json
 import pytest
 from typing import TYPE_CHECKING
 
+from pydantic import TypeAdapter
+
+from ea_nhl_stats.models.club import ClubData
+from ea_nhl_stats.models.game.ea_match import Match
+from ea_nhl_stats.models.game.ea_player_stats import PlayerStats
+from ea_nhl_stats.models.game.match_analytics import MatchAnalytics
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup for loading test data
+    orjson = None
+
 if TYPE_CHECKING:
     from _pytest.fixtures import FixtureRequest
     from _pytest.monkeypatch import MonkeyPatch
@@ -17,20 +29,47 @@ if TYPE_CHECKING:
 TEST_DIR = Path(__file__).parent
 # Define the directory containing the JSON test data
 JSON_DIR = TEST_DIR / "json"
+# Validates a whole match history in one call; the schema is built once
+_MATCH_LIST_ADAPTER = TypeAdapter(List[Match])
+# Validates every player of a club in one call
+_PLAYERS_ADAPTER = TypeAdapter(Dict[str, PlayerStats])
+# Builds the club_data_obj fixture; the schema is built once at import
+_CLUB_DATA_ADAPTER = TypeAdapter(ClubData)
 
-@pytest.fixture
-def club_response_data() -> Dict:
+
+def _load_json(json_path: Path) -> Any:
     """
-    Fixture providing sample club response data.
+    Load a JSON test data file.
     
+    Uses orjson when it is installed and falls back to the standard
+    library json module otherwise.
+    
+    Args:
+        json_path: Path to the JSON file
+        
     Returns:
-        Dictionary containing club response data from the NHL API
+        The decoded JSON document
     """
-    json_path = JSON_DIR / "club_response.json"
+    if orjson is not None:
+        return orjson.loads(json_path.read_bytes())
     with json_path.open("r") as f:
         return json.load(f)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def club_response_data() -> Dict:
+    """
+    Fixture providing sample club response data, parsed once per session.
+    
+    Tests must treat the returned data as read-only; copy the parts that
+    need modifying. Validating it is safe because the club validators
+    copy their input before converting it.
+    
+    Returns:
+        Dictionary containing club response data from the NHL API
+    """
+    return _load_json(JSON_DIR / "club_response.json")
+
+@pytest.fixture(scope="session")
 def club_id(club_response_data: Dict) -> str:
     """
     Fixture providing a sample club ID.
@@ -40,14 +79,153 @@ def club_id(club_response_data: Dict) -> str:
     """
     return next(iter(club_response_data.keys()))
 
+@pytest.fixture(scope="session")
+def first_club_entry(club_response_data: Dict) -> Tuple[str, Dict]:
+    """
+    Fixture providing the first club in the club response.
+    
+    Returns:
+        Tuple of the club ID and its raw club data
+    """
+    return next(iter(club_response_data.items()))
+
 @pytest.fixture
+def fresh_club_entry() -> Tuple[str, Dict]:
+    """
+    Fixture providing the first club, loaded from disk for each test.
+    
+    Use this instead of first_club_entry when the test needs data that no
+    earlier test can have touched.
+    
+    Returns:
+        Tuple of the club ID and its raw club data
+    """
+    return next(iter(_load_json(JSON_DIR / "club_response.json").items()))
+
+@pytest.fixture(scope="session")
+def club_data_obj(first_club_entry: Tuple[str, Dict]) -> ClubData:
+    """
+    Fixture providing the first club, validated once per session.
+    
+    Tests that only read fields should use this instead of validating
+    club_response_data themselves. Tests must not mutate it.
+    
+    Returns:
+        ClubData for club 36218 (JOE NHL)
+    """
+    _, data = first_club_entry
+    return _CLUB_DATA_ADAPTER.validate_python(data)
+
+@pytest.fixture(scope="session")
 def game_response_data() -> List[Dict]:
     """
-    Fixture providing sample game response data.
+    Fixture providing sample game response data, parsed once per session.
+    
+    Tests must treat the returned data as read-only; copy the parts that
+    need modifying.
     
     Returns:
         List of dictionaries containing game response data from the NHL API
     """
-    json_path = JSON_DIR / "response.json"
-    with json_path.open("r") as f:
-        return json.load(f)
\ No newline at end of file
+    return _load_json(JSON_DIR / "response.json")
+
+@pytest.fixture(scope="session")
+def home_away_clubs(game_response_data: List[Dict]) -> Tuple[Dict, Dict]:
+    """
+    Fixture providing the raw home and away clubs of the first game.
+    
+    Returns:
+        Tuple of the home (teamSide "0") and away (teamSide "1") club data
+    """
+    by_side = {c["teamSide"]: c for c in game_response_data[0]["clubs"].values()}
+    return by_side["0"], by_side["1"]
+
+@pytest.fixture(scope="session")
+def parsed_game_match(game_response_data: List[Dict]) -> Match:
+    """
+    Fixture providing the first game response match, validated once per session.
+    
+    Tests must not mutate it.
+    
+    Returns:
+        Match model for match 12370545490225 (JOE NHL vs CLAMMERS)
+    """
+    return Match.model_validate(game_response_data[0])
+
+@pytest.fixture(scope="session")
+def ea_response_data() -> List[Dict]:
+    """
+    Fixture providing EA API match history data, parsed once per session.
+    
+    Tests must treat the returned data as read-only; copy the parts that
+    need modifying.
+    
+    Returns:
+        List of dictionaries containing match data from the EA NHL API
+    """
+    return _load_json(JSON_DIR / "ea_response.json")
+
+@pytest.fixture(scope="session")
+def parsed_matches(ea_response_data: List[Dict]) -> List[Match]:
+    """
+    Fixture providing every EA API match, validated once per session.
+    
+    Tests must not mutate the returned models.
+    
+    Returns:
+        List of Match models in response order
+    """
+    return _MATCH_LIST_ADAPTER.validate_python(ea_response_data)
+
+@pytest.fixture(scope="session")
+def parsed_match(parsed_matches: List[Match]) -> Match:
+    """
+    Fixture providing the first EA API match, validated once per session.
+    
+    Tests that only read from the model should use this fixture instead of
+    calling Match.model_validate themselves. Tests must not mutate it.
+    
+    Returns:
+        Match model for match 14774884060144 (LG Blues vs LG Calgary Flames)
+    """
+    return parsed_matches[0]
+
+@pytest.fixture(scope="session")
+def analytics_by_match_id(parsed_matches: List[Match]) -> Dict[str, MatchAnalytics]:
+    """
+    Fixture providing one MatchAnalytics per parsed match for the session.
+    
+    Returns:
+        Dictionary mapping match ID to MatchAnalytics
+    """
+    return {m.match_id: MatchAnalytics(m) for m in parsed_matches}
+
+@pytest.fixture(scope="session")
+def player_totals(parsed_match: Match) -> Dict[str, Dict[str, int]]:
+    """
+    Fixture providing per-club skater totals for the parsed match.
+    
+    Returns:
+        Dictionary mapping club ID to summed hits, takeaways and giveaways
+    """
+    return {
+        club_id: {
+            "hits": sum(p.skhits for p in club.values()),
+            "takeaways": sum(p.sktakeaways for p in club.values()),
+            "giveaways": sum(p.skgiveaways for p in club.values()),
+        }
+        for club_id, club in parsed_match.players.items()
+    }
+
+@pytest.fixture(scope="session")
+def club_1789_players(ea_response_data: List[Dict]) -> Dict[str, PlayerStats]:
+    """
+    Fixture providing the LG Blues players from the first EA API match.
+    
+    All players are validated in one call, independently of Match.
+    Tests must not mutate the returned models.
+    
+    Returns:
+        Dictionary mapping player ID to PlayerStats for club 1789
+    """
+    return _PLAYERS_ADAPTER.validate_python(ea_response_data[0]["players"]["1789"])
@@ -0,0 +1,49 @@
+"""Shared pytest fixtures for league tests."""
+
+import pytest
+
+from ea_nhl_stats.league.enums.league_level import LeagueLevel
+from ea_nhl_stats.league.enums.team_identifier import TeamIdentifier
+from ea_nhl_stats.league.enums.types import Position
+from ea_nhl_stats.league.models.players.league_player import LeaguePlayer
+from ea_nhl_stats.league.models.season import TierData
+from ea_nhl_stats.league.models.teams.base_team import LeagueTeam
+
+
+@pytest.fixture
+def tier_data() -> TierData:
+    """
+    Fixture providing an empty tier.
+
+    Returns:
+        A new TierData instance for each test, since tests add to it
+    """
+    return TierData()
+
+@pytest.fixture(scope="module")
+def team() -> LeagueTeam:
+    """
+    Fixture providing a test team shared across a module.
+
+    Returns:
+        LeagueTeam for the St. Louis Blues; tests must not mutate it
+    """
+    return LeagueTeam(
+        official_name=TeamIdentifier.ST_LOUIS_BLUES.value,
+        league_level=LeagueLevel.NHL
+    )
+
+@pytest.fixture(scope="module")
+def player() -> LeaguePlayer:
+    """
+    Fixture providing a test player shared across a module.
+
+    Returns:
+        LeaguePlayer with EA identifiers; tests must not mutate it
+    """
+    return LeaguePlayer(
+        name="Test Player",
+        position=Position.CENTER,
+        ea_id="12345",
+        ea_name="EA Test Player"
+    )
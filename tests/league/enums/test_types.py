@@ -20,14 +20,6 @@ def test_manager_role_values():
     assert ManagerRole.PAID_AGM.value == "paid_agm"
 
 
-def test_manager_role_comparison():
-    """Test manager role comparison."""
-    role = ManagerRole.GM
-    assert role == ManagerRole.GM
-    assert role != ManagerRole.OWNER
-    assert role in ManagerRole
-
-
 def test_position_values():
     """Test position enum values."""
     # Test all positions exist
@@ -39,15 +31,27 @@ def test_position_values():
     assert Position.GOALIE
 
 
-def test_position_comparison():
-    """Test position comparison."""
-    pos = Position.CENTER
-    assert pos == Position.CENTER
-    assert pos != Position.LEFT_WING
-    assert pos in Position
+@pytest.mark.parametrize("member, other", [
+    pytest.param(ManagerRole.GM, ManagerRole.OWNER, id="manager_role"),
+    pytest.param(Position.CENTER, Position.LEFT_WING, id="position"),
+])
+def test_enum_comparison(member, other):
+    """Test comparison of enum members."""
+    enum_class = type(member)
+    assert member == enum_class[member.name]
+    assert member != other
+    assert member in enum_class
 
 
 def test_position_uniqueness():
     """Test that all position values are unique."""
     values = [pos.value for pos in Position]
-    assert len(values) == len(set(values))  # No duplicates 
\ No newline at end of file
+    assert len(values) == len(set(values))  # No duplicates 
+
+
+def test_position_hashes_as_int():
+    """Test that positions hash and compare as their int values."""
+    for pos in Position:
+        assert hash(pos) == hash(pos.value)
+        assert pos == pos.value
+    assert {Position.CENTER, Position.CENTER} == {Position.CENTER}
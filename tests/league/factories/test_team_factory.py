@@ -85,7 +85,5 @@ def test_team_factory_create_with_kwargs(clear_factory, mock_team_class):
 def test_team_factory_unregistered_identifier(clear_factory):
     """Test factory behavior with unregistered team identifier."""
     # Try to create a team that isn't registered
-    with pytest.raises(ValueError) as exc_info:
-        TeamFactory.create(TeamIdentifier.CALGARY_FLAMES)
-    
-    assert "No implementation for team" in str(exc_info.value) 
\ No newline at end of file
+    with pytest.raises(ValueError, match="No implementation for team"):
+        TeamFactory.create(TeamIdentifier.CALGARY_FLAMES) 
\ No newline at end of file
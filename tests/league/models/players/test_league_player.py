@@ -2,7 +2,6 @@
 
 from typing import TYPE_CHECKING
 from uuid import UUID
-import json
 
 import pytest
 
@@ -17,13 +16,6 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
-@pytest.fixture
-def ea_response_data():
-    """Load test EA API response data."""
-    with open("live_tests/output/ea_response.json") as f:
-        return json.load(f)
-
-
 @pytest.fixture
 def player_data():
     """Fixture providing basic player data."""
@@ -35,6 +27,17 @@ def player_data():
     }
 
 
+@pytest.fixture
+def make_player(player_data):
+    """Fixture providing a factory for players built from player_data.
+    
+    Keyword arguments override the matching player_data fields.
+    """
+    def _make_player(**overrides) -> LeaguePlayer:
+        return LeaguePlayer(**{**player_data, **overrides})
+    return _make_player
+
+
 @pytest.fixture
 def test_ea_stats(ea_response_data):
     """Create test EA NHL stats."""
@@ -43,9 +46,9 @@ def test_ea_stats(ea_response_data):
     return EAPlayerStats.model_validate(skater_data)
 
 
-def test_league_player_initialization(player_data):
+def test_league_player_initialization(make_player, player_data):
     """Test basic player initialization."""
-    player = LeaguePlayer(**player_data)
+    player = make_player()
     assert player.name == player_data["name"]
     assert player.position == player_data["position"]
     assert player.ea_id == player_data["ea_id"]
@@ -55,13 +58,11 @@ def test_league_player_initialization(player_data):
     assert player.current_team is None  # Not on a team yet
 
 
-def test_league_player_with_manager_role():
+def test_league_player_with_manager_role(make_player):
     """Test player initialization with manager role."""
     manager_info = ManagerInfo(role=ManagerRole.GM, is_active=True)
-    player = LeaguePlayer(
+    player = make_player(
         name="Test Manager",
-        position=Position.CENTER,
-        ea_id="12345",
         ea_name="EA Test Manager",
         manager_info=manager_info
     )
@@ -89,9 +90,9 @@ def test_league_player_team_management():
     assert team_id in player.team_stats  # Stats remain
 
 
-def test_league_player_add_game_stats(player_data, test_ea_stats):
+def test_league_player_add_game_stats(make_player, test_ea_stats):
     """Test adding game stats to a player."""
-    player = LeaguePlayer(**player_data)
+    player = make_player()
     team_id = TeamIdentifier.ST_LOUIS_BLUES
     match_id = UUID('123e4567-e89b-12d3-a456-426614174000')
     
@@ -107,9 +108,9 @@ def test_league_player_add_game_stats(player_data, test_ea_stats):
     assert player.position in team_stats.positions
 
 
-def test_league_player_multiple_games_stats(player_data, test_ea_stats):
+def test_league_player_multiple_games_stats(make_player, test_ea_stats):
     """Test adding multiple games worth of stats."""
-    player = LeaguePlayer(**player_data)
+    player = make_player()
     team_id = TeamIdentifier.ST_LOUIS_BLUES
     match1_id = UUID('123e4567-e89b-12d3-a456-426614174000')
     match2_id = UUID('123e4567-e89b-12d3-a456-426614174001')
@@ -127,25 +128,13 @@ def test_league_player_multiple_games_stats(player_data, test_ea_stats):
     assert team_stats.assists == 2  # 1 assist per game
 
 
-def test_league_player_equality():
+def test_league_player_equality(make_player):
     """Test player equality comparison."""
-    player1 = LeaguePlayer(
-        name="Test Player",
-        position=Position.CENTER,
-        ea_id="12345",
-        ea_name="EA Test Player"
-    )
+    player1 = make_player()
     # Create player2 with same ID as player1
-    player2 = LeaguePlayer(
-        id=player1.id,  # Same ID
-        name="Test Player",
-        position=Position.CENTER,
-        ea_id="12345",
-        ea_name="EA Test Player"
-    )
-    player3 = LeaguePlayer(
+    player2 = make_player(id=player1.id)  # Same ID
+    player3 = make_player(
         name="Different Player",
-        position=Position.CENTER,
         ea_id="67890",
         ea_name="EA Different Player"
     )
@@ -155,27 +144,17 @@ def test_league_player_equality():
     assert player1 != "not a player"  # Different type
 
 
-def test_league_player_str_representation():
+def test_league_player_str_representation(make_player):
     """Test player string representation."""
-    player = LeaguePlayer(
-        name="Test Player",
-        position=Position.CENTER,
-        ea_id="12345",
-        ea_name="EA Test Player"
-    )
+    player = make_player()
     str_repr = str(player)
     assert "Test Player" in str_repr
     assert str(Position.CENTER) in str_repr
     assert str(player.id) in str_repr  # Check for formatted UUID
 
 
-def test_league_player_invalid_position():
+def test_league_player_invalid_position(make_player):
     """Test player initialization with invalid position."""
     with pytest.raises(ValueError):
-        LeaguePlayer(
-            name="Test Player",
-            position="invalid",  # type: ignore
-            ea_id="12345",
-            ea_name="EA Test Player"
-        )
+        make_player(position="invalid")
     
\ No newline at end of file
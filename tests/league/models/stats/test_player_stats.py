@@ -1,11 +1,8 @@
 """Tests for player statistics model."""
 
-import json
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-import pytest
-
 from ea_nhl_stats.league.models.stats.player_stats import PlayerStats
 from ea_nhl_stats.models.game.ea_player_stats import PlayerStats as EAPlayerStats
 from ea_nhl_stats.league.enums.types import Position
@@ -16,13 +13,6 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
-@pytest.fixture
-def ea_response_data():
-    """Load test EA API response data."""
-    with open("live_tests/output/ea_response.json") as f:
-        return json.load(f)
-
-
 def test_track_skater_stats(ea_response_data):
     """Test tracking skater stats from EA data."""
     # Get vViperrz's stats from the response
@@ -38,21 +28,23 @@ def test_track_skater_stats(ea_response_data):
     stats.games_played += 1
     stats.positions.add(Position.LEFT_WING)
     
-    # Test core stats
-    assert stats.goals == 3
-    assert stats.assists == 1
-    assert stats.points == 4
-    assert stats.shots == 6
-    assert stats.hits == 10
-    assert stats.takeaways == 0
-    assert stats.giveaways == 16
-    assert stats.penalty_minutes == 4
-    assert stats.plus_minus == -2
-    
-    # Test computed stats
-    assert stats.shooting_percentage == 50.0  # 3 goals on 6 shots
-    assert stats.points_per_game == 4.0  # 4 points in 1 game
-    assert stats.takeaway_giveaway_ratio == 0.0  # 0 takeaways, 16 giveaways
+    # Test core and computed stats in a single comparison
+    expected = {
+        "goals": 3,
+        "assists": 1,
+        "points": 4,
+        "shots": 6,
+        "hits": 10,
+        "takeaways": 0,
+        "giveaways": 16,
+        "penalty_minutes": 4,
+        "plus_minus": -2,
+        "shooting_percentage": 50.0,  # 3 goals on 6 shots
+        "points_per_game": 4.0,  # 4 points in 1 game
+        "takeaway_giveaway_ratio": 0.0,  # 0 takeaways, 16 giveaways
+    }
+    actual = {name: getattr(stats, name) for name in expected}
+    assert actual == expected
 
 
 def test_track_goalie_stats(ea_response_data):
@@ -17,43 +17,30 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
-def test_st_louis_blues_initialization():
-    """Test St. Louis Blues team initialization."""
-    team = StLouisBlues()
-    assert team.official_name == TeamIdentifier.ST_LOUIS_BLUES.value
-    assert team.league_level == LeagueLevel.NHL
-
-
-def test_st_louis_blues_with_data():
-    """Test St. Louis Blues team initialization with additional data."""
-    ea_club_id = "123"
-    ea_club_name = "Test Blues"
-    team = StLouisBlues(
-        ea_club_id=ea_club_id,
-        ea_club_name=ea_club_name
-    )
-    assert team.official_name == TeamIdentifier.ST_LOUIS_BLUES.value
-    assert team.league_level == LeagueLevel.NHL
-    assert team.ea_club_id == ea_club_id
-    assert team.ea_club_name == ea_club_name
+TEAM_IMPLEMENTATIONS = [
+    pytest.param(StLouisBlues, TeamIdentifier.ST_LOUIS_BLUES, id="st_louis_blues"),
+    pytest.param(CalgaryFlames, TeamIdentifier.CALGARY_FLAMES, id="calgary_flames"),
+]
 
 
-def test_calgary_flames_initialization():
-    """Test Calgary Flames team initialization."""
-    team = CalgaryFlames()
-    assert team.official_name == TeamIdentifier.CALGARY_FLAMES.value
+@pytest.mark.parametrize("team_class, identifier", TEAM_IMPLEMENTATIONS)
+def test_team_initialization(team_class, identifier):
+    """Test team implementation initialization."""
+    team = team_class()
+    assert team.official_name == identifier.value
     assert team.league_level == LeagueLevel.NHL
 
 
-def test_calgary_flames_with_data():
-    """Test Calgary Flames team initialization with additional data."""
-    ea_club_id = "456"
-    ea_club_name = "Test Flames"
-    team = CalgaryFlames(
+@pytest.mark.parametrize("team_class, identifier", TEAM_IMPLEMENTATIONS)
+def test_team_with_data(team_class, identifier):
+    """Test team implementation initialization with additional data."""
+    ea_club_id = "123"
+    ea_club_name = f"Test {identifier.name}"
+    team = team_class(
         ea_club_id=ea_club_id,
         ea_club_name=ea_club_name
     )
-    assert team.official_name == TeamIdentifier.CALGARY_FLAMES.value
+    assert team.official_name == identifier.value
     assert team.league_level == LeagueLevel.NHL
     assert team.ea_club_id == ea_club_id
-    assert team.ea_club_name == ea_club_name 
\ No newline at end of file
+    assert team.ea_club_name == ea_club_name
@@ -26,19 +26,12 @@ def season() -> Season:
     return Season(season_id="2024", tiers={})
 
 
-@pytest.fixture
-def tier_data() -> TierData:
-    """Create a test tier."""
-    return TierData()
-
-
 def test_season_initialization() -> None:
     """Test that Season initializes correctly."""
     season = Season(season_id="2024", tiers={})
     
     assert season.season_id == "2024"
-    assert isinstance(season.tiers, dict)
-    assert len(season.tiers) == 0
+    assert season.tiers == {}
 
 
 def test_season_add_tier(season: Season, tier_data: TierData) -> None:
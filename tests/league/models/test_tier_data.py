@@ -1,7 +1,7 @@
 """Tests for the TierData model."""
 
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 import pytest
 from pytest_mock.plugin import MockerFixture
@@ -20,38 +20,16 @@ if TYPE_CHECKING:
     from _pytest.monkeypatch import MonkeyPatch
 
 
-@pytest.fixture
-def tier_data() -> TierData:
-    """Create a test tier."""
-    return TierData()
-
-
-@pytest.fixture
-def team() -> LeagueTeam:
-    """Create a test team."""
-    return LeagueTeam(
-        official_name=TeamIdentifier.ST_LOUIS_BLUES.value,
-        league_level=LeagueLevel.NHL
-    )
-
-
-@pytest.fixture
-def player() -> LeaguePlayer:
-    """Create a test player."""
-    return LeaguePlayer(
-        name="Test Player",
-        position=Position.CENTER
-    )
+# Any UUID works for lookups that are expected to miss
+MISSING_PLAYER_ID = UUID("00000000-0000-0000-0000-000000000000")
 
 
 def test_tier_data_initialization() -> None:
     """Test that TierData initializes with empty dictionaries."""
     tier = TierData()
     
-    assert isinstance(tier.teams, dict)
-    assert isinstance(tier.players, dict)
-    assert len(tier.teams) == 0
-    assert len(tier.players) == 0
+    assert tier.teams == {}
+    assert tier.players == {}
 
 
 def test_add_and_get_team(tier_data: TierData, team: LeagueTeam) -> None:
@@ -76,16 +54,14 @@ def test_add_and_get_player(tier_data: TierData, player: LeaguePlayer) -> None:
     assert tier_data.players[player_id] == player
 
 
-def test_get_nonexistent_team(tier_data: TierData) -> None:
-    """Test getting a team that doesn't exist raises KeyError."""
-    with pytest.raises(KeyError):
-        _ = tier_data.teams[TeamIdentifier.ST_LOUIS_BLUES]
-
-
-def test_get_nonexistent_player(tier_data: TierData) -> None:
-    """Test getting a player that doesn't exist raises KeyError."""
+@pytest.mark.parametrize("registry, key", [
+    pytest.param("teams", TeamIdentifier.ST_LOUIS_BLUES, id="team"),
+    pytest.param("players", MISSING_PLAYER_ID, id="player"),
+])
+def test_get_nonexistent_entry(tier_data: TierData, registry: str, key) -> None:
+    """Test getting a team or player that doesn't exist raises KeyError."""
     with pytest.raises(KeyError):
-        _ = tier_data.players[uuid4()]
+        _ = getattr(tier_data, registry)[key]
 
 
 def test_multiple_teams(tier_data: TierData) -> None:
@@ -0,0 +1,80 @@
+"""Integration tests for tracking league stats from EA match data."""
+
+from uuid import UUID
+
+import pytest
+
+from ea_nhl_stats.league.enums.team_identifier import TeamIdentifier
+from ea_nhl_stats.league.enums.types import ManagerRole, Position
+from ea_nhl_stats.league.models.players.league_player import LeaguePlayer, ManagerInfo
+from ea_nhl_stats.models.game.ea_match import Match
+
+
+# League teams standing in for the two EA clubs in the first game
+CLUB_TEAMS = {
+    "36218": TeamIdentifier.ST_LOUIS_BLUES,  # JOE NHL
+    "9688": TeamIdentifier.CALGARY_FLAMES,  # CLAMMERS
+}
+
+
+# Managers who played in the first game, with the EA club they played for
+MANAGERS = [
+    pytest.param(
+        "1004141883766", "36218", "habsy_oiler",
+        Position.LEFT_WING, ManagerRole.GM,
+        id="habsy_oiler",
+    ),
+    pytest.param(
+        "1006828925835", "36218", "Mapleleafsfan1_",
+        Position.LEFT_DEFENSE, ManagerRole.AGM,
+        id="mapleleafsfan1",
+    ),
+    pytest.param(
+        "1003887858515", "9688", "NickSoub",
+        Position.RIGHT_DEFENSE, ManagerRole.GM,
+        id="nicksoub",
+    ),
+    pytest.param(
+        "1004418691339", "9688", "Mr Lesp",
+        Position.CENTER, ManagerRole.AGM,
+        id="mr_lesp",
+    ),
+]
+
+
+@pytest.mark.parametrize("ea_id, club_id, name, position, role", MANAGERS)
+def test_track_manager_stats(
+    parsed_game_match: Match,
+    ea_id: str,
+    club_id: str,
+    name: str,
+    position: Position,
+    role: ManagerRole,
+):
+    """Test recording a game's EA stats against a manager who played in it."""
+    match = parsed_game_match
+    match_id = UUID(int=int(match.match_id))
+    manager = LeaguePlayer(
+        name=name,
+        position=position,
+        ea_id=ea_id,
+        manager_info=ManagerInfo(role=role)
+    )
+
+    player_stats = match.get_player_stats(club_id, ea_id)
+    assert player_stats is not None
+    manager.add_game_stats(CLUB_TEAMS[club_id], match_id, player_stats)
+
+    assert list(manager.team_stats) == [CLUB_TEAMS[club_id]]
+    stats = manager.team_stats[CLUB_TEAMS[club_id]]
+
+    assert stats.games_played == 1
+    assert stats.positions == {position}
+    assert stats.goals == player_stats.skgoals
+    assert stats.assists == player_stats.skassists
+    assert stats.shots == player_stats.skshots
+    assert stats.hits == player_stats.skhits
+    assert stats.takeaways == player_stats.sktakeaways
+    assert stats.giveaways == player_stats.skgiveaways
+    assert stats.penalty_minutes == player_stats.skpim
+    assert stats.plus_minus == player_stats.skplusmin
@@ -1,17 +1,11 @@
 """Tests for base game data models."""
 
-from typing import Dict, TYPE_CHECKING
+from typing import Dict
 
-import pytest
 from pydantic import BaseModel
 
 from ea_nhl_stats.models.game.base import NumericValidatorBase
 
-if TYPE_CHECKING:
-    from _pytest.fixtures import FixtureRequest
-    from _pytest.monkeypatch import MonkeyPatch
-    from pytest_mock.plugin import MockerFixture
-
 
 def test_numeric_validator_base_handles_dashes() -> None:
     """Test that NumericValidatorBase properly handles '--' values."""
@@ -1,34 +1,25 @@
 """Tests for EA NHL club statistics models."""
 
-import json
-from typing import TYPE_CHECKING
-
-import pytest
+from pydantic import TypeAdapter
 
 from ea_nhl_stats.models.game.ea_club_stats import ClubStats, AggregateStats
 
-if TYPE_CHECKING:
-    from _pytest.fixtures import FixtureRequest
-    from _pytest.logging import LogCaptureFixture
-    from pytest_mock import MockerFixture
-
 
-@pytest.fixture
-def ea_response_data():
-    """Load test EA API response data."""
-    with open("live_tests/output/ea_response.json") as f:
-        return json.load(f)
+# Adapters are built once at import and reused by every test
+_CLUB_ADAPTER = TypeAdapter(ClubStats)
+_AGG_ADAPTER = TypeAdapter(AggregateStats)
 
 
 def test_parse_club_stats(ea_response_data):
     """Test parsing club stats from EA API response."""
     club_data = ea_response_data[0]["clubs"]["1789"]  # LG Blues
     
-    club = ClubStats.model_validate(club_data)
+    club = _CLUB_ADAPTER.validate_python(club_data)
     
     # Test basic info
     assert club.club_division == 10
     assert club.cnhl_online_game_type == "5"  # Game type code
+    assert club.team_side == 0  # Home
     
     # Test game results
     assert club.goals == 10
@@ -56,7 +47,7 @@ def test_parse_aggregate_stats(ea_response_data):
     """Test parsing aggregate stats from EA API response."""
     agg_data = ea_response_data[0]["aggregate"]["1789"]  # LG Blues
     
-    agg = AggregateStats.model_validate(agg_data)
+    agg = _AGG_ADAPTER.validate_python(agg_data)
     
     # Test basic info
     assert agg.club_level == 57  # Actual club level
@@ -1,32 +1,9 @@
 """Tests for EA NHL match model."""
 
-import json
-from typing import TYPE_CHECKING
 
-import pytest
-
-from ea_nhl_stats.models.game.ea_match import Match
-
-if TYPE_CHECKING:
-    from _pytest.fixtures import FixtureRequest
-    from _pytest.logging import LogCaptureFixture
-    from pytest_mock import MockerFixture
-
-
-@pytest.fixture
-def ea_response_data():
-    """Load test EA API response data."""
-    with open("live_tests/output/ea_response.json") as f:
-        return json.load(f)
-
-
-def test_parse_match(ea_response_data):
+def test_parse_match(parsed_match):
     """Test parsing a full match from EA API response."""
-    # Get first match from response
-    match_data = ea_response_data[0]
-    
-    # Parse into Match model
-    match = Match.model_validate(match_data)
+    match = parsed_match
     
     # Verify basic match data
     assert match.match_id == "14774884060144"
@@ -48,9 +25,9 @@ def test_parse_match(ea_response_data):
     assert "45048" in match.aggregate
 
 
-def test_match_properties(ea_response_data):
+def test_match_properties(parsed_match):
     """Test Match model helper properties."""
-    match = Match.model_validate(ea_response_data[0])
+    match = parsed_match
     
     # Test home/away club IDs
     assert match.home_club_id == "1789"  # team_side = 0
@@ -69,9 +46,9 @@ def test_match_properties(ea_response_data):
     assert match.away_aggregate is not None
 
 
-def test_match_helper_methods(ea_response_data):
+def test_match_helper_methods(parsed_match):
     """Test Match model helper methods."""
-    match = Match.model_validate(ea_response_data[0])
+    match = parsed_match
     
     # Test get_club_players
     blues_players = match.get_club_players("1789")
@@ -86,4 +63,11 @@ def test_match_helper_methods(ea_response_data):
     # Test get_club_aggregate
     blues_agg = match.get_club_aggregate("1789")
     assert blues_agg is not None
-    assert blues_agg.skgoals == 10 
\ No newline at end of file
+    assert blues_agg.skgoals == 10
+
+
+def test_parse_match_history(ea_response_data, parsed_matches):
+    """Test that every match in the EA API response parses."""
+    assert len(parsed_matches) == len(ea_response_data)
+    assert [m.match_id for m in parsed_matches] == [d["matchId"] for d in ea_response_data]
+    assert all(len(m.clubs) == 2 for m in parsed_matches)
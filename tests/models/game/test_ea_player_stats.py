@@ -1,31 +1,10 @@
 """Tests for EA NHL player statistics model."""
 
-import json
-from typing import TYPE_CHECKING
 
-import pytest
-
-from ea_nhl_stats.models.game.ea_player_stats import PlayerStats
-
-if TYPE_CHECKING:
-    from _pytest.fixtures import FixtureRequest
-    from _pytest.logging import LogCaptureFixture
-    from pytest_mock import MockerFixture
-
-
-@pytest.fixture
-def ea_response_data():
-    """Load test EA API response data."""
-    with open("live_tests/output/ea_response.json") as f:
-        return json.load(f)
-
-
-def test_parse_skater_stats(ea_response_data):
+def test_parse_skater_stats(club_1789_players):
     """Test parsing skater stats from EA API response."""
     # vViperrz - Left Wing
-    skater_data = ea_response_data[0]["players"]["1789"]["1669236396"]
-    
-    skater = PlayerStats.model_validate(skater_data)
+    skater = club_1789_players["1669236396"]
     
     # Test basic info
     assert skater.position == "leftWing"
@@ -54,12 +33,10 @@ def test_parse_skater_stats(ea_response_data):
     assert skater.passing_percentage == 63.16
 
 
-def test_parse_goalie_stats(ea_response_data):
+def test_parse_goalie_stats(club_1789_players):
     """Test parsing goalie stats from EA API response."""
     # Pxtlick - Goalie
-    goalie_data = ea_response_data[0]["players"]["1789"]["1719294631"]
-    
-    goalie = PlayerStats.model_validate(goalie_data)
+    goalie = club_1789_players["1719294631"]
     
     # Test basic info
     assert goalie.position == "goalie"
@@ -89,14 +66,11 @@ def test_parse_goalie_stats(ea_response_data):
     assert goalie.glpensavepct == 0.0
 
 
-def test_parse_player_ratings(ea_response_data):
+def test_parse_player_ratings(club_1789_players):
     """Test parsing player ratings from EA API response."""
     # Test both skater and goalie ratings
-    skater_data = ea_response_data[0]["players"]["1789"]["1669236396"]  # vViperrz
-    goalie_data = ea_response_data[0]["players"]["1789"]["1719294631"]  # Pxtlick
-    
-    skater = PlayerStats.model_validate(skater_data)
-    goalie = PlayerStats.model_validate(goalie_data)
+    skater = club_1789_players["1669236396"]  # vViperrz
+    goalie = club_1789_players["1719294631"]  # Pxtlick
     
     # Test skater ratings
     assert skater.rating_offense == 100.0
@@ -1,53 +1,130 @@
 """Tests for match analytics functionality."""
 
-from typing import TYPE_CHECKING, List
-import json
 import pytest
-from ea_nhl_stats.models.game.match_analytics import MatchAnalytics
 from ea_nhl_stats.models.game.ea_match import Match
+from ea_nhl_stats.models.game.match_analytics import MatchAnalytics
 
-if TYPE_CHECKING:
-    from pytest_mock.plugin import MockerFixture
 
+# Expected runtime type of every field on each metrics dataclass
+EXPECTED_POSSESSION_TYPES = {
+    "possession_differential": float,
+    "possession_percentage_home": float,
+    "possession_percentage_away": float,
+    "time_on_attack_differential": float,
+}
+EXPECTED_EFFICIENCY_TYPES = {
+    "home_shooting_efficiency": float,
+    "away_shooting_efficiency": float,
+    "home_passing_efficiency": float,
+    "away_passing_efficiency": float,
+    "home_possession_efficiency": float,
+    "away_possession_efficiency": float,
+}
+EXPECTED_SPECIAL_TEAMS_TYPES = {
+    "home_powerplay_pct": float,
+    "away_powerplay_pct": float,
+    "home_penalty_kill_pct": float,
+    "away_penalty_kill_pct": float,
+}
+EXPECTED_MOMENTUM_TYPES = {
+    "home_score": float,
+    "away_score": float,
+    "shot_differential": int,
+    "hit_differential": int,
+    "takeaway_differential": int,
+    "scoring_chances_differential": int,
+}
 
-@pytest.fixture
-def ea_response_data():
-    """Load test EA API response data."""
-    with open("live_tests/output/ea_response.json") as f:
-        return json.load(f)
 
+@pytest.fixture(scope="module")
+def analytics(analytics_by_match_id) -> MatchAnalytics:
+    """Get the session's analytics for match 14774884060144."""
+    return analytics_by_match_id["14774884060144"]
 
-@pytest.fixture
-def test_match(ea_response_data) -> Match:
-    """Create test match from EA API data."""
-    return Match.model_validate(ea_response_data[0])
 
+@pytest.fixture(scope="module")
+def all_metrics(analytics):
+    """Compute every metric group once for the module."""
+    return analytics.get_all_metrics()
 
-def test_match_analytics(test_match):
-    """Test match analytics functionality."""
-    analytics = MatchAnalytics(test_match)
-    
-    # Test possession metrics
-    possession = analytics.get_possession_metrics()
+
+@pytest.fixture(scope="session")
+def expected_momentum(player_totals):
+    """Derive the home-minus-away momentum differentials from player totals."""
+    home, away = player_totals["1789"], player_totals["45048"]
+    return {
+        "hit_diff": home["hits"] - away["hits"],
+        "takeaway_diff": (
+            (home["takeaways"] - home["giveaways"]) - (away["takeaways"] - away["giveaways"])
+        ),
+    }
+
+
+def test_possession_metrics(all_metrics):
+    """Test possession metrics."""
+    possession = all_metrics["possession"]
     assert possession is not None
-    assert isinstance(possession.possession_differential, float)
-    assert isinstance(possession.possession_percentage_home, float)
-    assert isinstance(possession.possession_percentage_away, float)
-    
-    # Test efficiency metrics
-    efficiency = analytics.get_efficiency_metrics()
+    actual = {name: type(getattr(possession, name)) for name in EXPECTED_POSSESSION_TYPES}
+    assert actual == EXPECTED_POSSESSION_TYPES
+    assert possession.possession_percentage_home == pytest.approx(46.65, rel=1e-2)
+    assert possession.possession_percentage_away == pytest.approx(53.35, rel=1e-2)
+
+
+def test_efficiency_metrics(all_metrics):
+    """Test efficiency metrics."""
+    efficiency = all_metrics["efficiency"]
     assert efficiency is not None
-    assert isinstance(efficiency.home_shooting_efficiency, float)
-    assert isinstance(efficiency.away_shooting_efficiency, float)
-    
-    # Test special teams metrics
-    special_teams = analytics.get_special_teams_metrics()
+    actual = {name: type(getattr(efficiency, name)) for name in EXPECTED_EFFICIENCY_TYPES}
+    assert actual == EXPECTED_EFFICIENCY_TYPES
+    assert efficiency.home_shooting_efficiency == pytest.approx(45.45, rel=1e-2)
+    assert efficiency.home_passing_efficiency == pytest.approx(78.35, rel=1e-2)
+
+
+def test_special_teams_metrics(all_metrics):
+    """Test special teams metrics."""
+    special_teams = all_metrics["special_teams"]
     assert special_teams is not None
-    assert isinstance(special_teams.home_powerplay_pct, float)
-    assert isinstance(special_teams.away_powerplay_pct, float)
-    
-    # Test momentum metrics
-    momentum = analytics.get_momentum_metrics()
+    actual = {name: type(getattr(special_teams, name)) for name in EXPECTED_SPECIAL_TEAMS_TYPES}
+    assert actual == EXPECTED_SPECIAL_TEAMS_TYPES
+    # Whole-number percentages come out exact, so no tolerance is needed
+    assert special_teams.home_powerplay_pct == 75.0
+    assert special_teams.away_powerplay_pct == 50.0
+    assert special_teams.home_penalty_kill_pct == 50.0
+    assert special_teams.away_penalty_kill_pct == 25.0
+
+
+def test_momentum_metrics(all_metrics, expected_momentum):
+    """Test momentum metrics."""
+    momentum = all_metrics["momentum"]
     assert momentum is not None
-    assert isinstance(momentum.shot_differential, int)
-    assert isinstance(momentum.hit_differential, int) 
\ No newline at end of file
+    actual = {name: type(getattr(momentum, name)) for name in EXPECTED_MOMENTUM_TYPES}
+    assert actual == EXPECTED_MOMENTUM_TYPES
+    
+    # Differentials should agree with the per-player totals
+    assert momentum.hit_differential == expected_momentum["hit_diff"]
+    assert momentum.takeaway_differential == expected_momentum["takeaway_diff"]
+
+
+def test_get_all_metrics(analytics, all_metrics):
+    """Test that get_all_metrics matches the individual metric getters."""
+    assert all_metrics == {
+        "possession": analytics.get_possession_metrics(),
+        "efficiency": analytics.get_efficiency_metrics(),
+        "special_teams": analytics.get_special_teams_metrics(),
+        "momentum": analytics.get_momentum_metrics(),
+    }
+
+
+def test_handle_missing_data(ea_response_data):
+    """Test that every metric group is None when club data is missing."""
+    # Shallow copy so the shared session data is left untouched
+    match_data = {**ea_response_data[0], "clubs": {}, "players": {}, "aggregate": {}}
+    match = Match.model_validate(match_data)
+    
+    metrics = MatchAnalytics(match).get_all_metrics()
+    assert metrics == {
+        "possession": None,
+        "efficiency": None,
+        "special_teams": None,
+        "momentum": None,
+    }
@@ -0,0 +1,98 @@
+"""Tests for club data models.
+
+These tests exercise full validation on purpose. Structural checks run on
+validated output, since checking types on a model_construct result
+would only test how the test built it.
+"""
+
+import copy
+import re
+from typing import Dict, Tuple
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from ea_nhl_stats.models.club import ClubData, ClubInfo, ClubResponse, CustomKit
+
+
+# Adapters are built once at import and reused by every test
+_CLUB_DATA_ADAPTER = TypeAdapter(ClubData)
+_CLUB_RESPONSE_ADAPTER = TypeAdapter(ClubResponse)
+
+# Expected validation messages, compiled once for pytest.raises(match=...)
+_INTEGER_ERR = re.compile(r"Invalid integer value for field 'wins'")
+_SCORE_ERR = re.compile(r"Score must be in the format 'int-int'")
+
+
+@pytest.mark.parametrize("loader", [
+    pytest.param(
+        lambda data: _CLUB_DATA_ADAPTER.validate_python(next(iter(data.values()))),
+        id="club_data",
+    ),
+    pytest.param(
+        lambda data: next(iter(
+            _CLUB_RESPONSE_ADAPTER.validate_python(data).root.values()
+        )),
+        id="club_response",
+    ),
+])
+def test_club_identity(loader, club_response_data: Dict) -> None:
+    """Test that every validation entry point yields the same club."""
+    club = loader(club_response_data)
+
+    assert (club.club_id, club.name, club.platform) == (36218, "JOE NHL", "common-gen5")
+
+
+def test_club_data_fields(club_data_obj: ClubData) -> None:
+    """Test that club data fields are converted from the raw response."""
+    assert club_data_obj.seasons == 2
+    assert club_data_obj.ranking_points == 15
+    assert club_data_obj.record == "2-17-1"
+    assert club_data_obj.recent_result0 == 1
+    assert club_data_obj.recent_score0 == "5-3"
+    assert club_data_obj.club_info.team_id == 264
+    assert club_data_obj.club_info.custom_kit.is_custom_team == 1
+    assert club_data_obj.club_info.custom_kit.crest_asset_id == "348"
+
+
+def test_club_response_model_validates(club_response_data: Dict, club_id: str) -> None:
+    """Test that a club response validates into the nested model types."""
+    response = _CLUB_RESPONSE_ADAPTER.validate_python(club_response_data)
+    club = response.root[club_id]
+
+    assert isinstance(club, ClubData)
+    assert isinstance(club.club_info, ClubInfo)
+    assert isinstance(club.club_info.custom_kit, CustomKit)
+
+
+def test_club_data_does_not_mutate_input(fresh_club_entry: Tuple[str, Dict]) -> None:
+    """Test that validating club data leaves the source dictionary unchanged."""
+    _, raw = fresh_club_entry
+    assert isinstance(raw["wins"], str)
+    snapshot = copy.deepcopy(raw)
+
+    _CLUB_DATA_ADAPTER.validate_python(raw)
+
+    assert raw == snapshot
+    assert raw["wins"] == "2"
+
+
+@pytest.mark.parametrize("overrides, match", [
+    pytest.param({"wins": "nope"}, _INTEGER_ERR, id="integer_field"),
+    pytest.param({"recentScore0": "123"}, _SCORE_ERR, id="score_format"),
+])
+def test_invalid_club_data(
+    first_club_entry: Tuple[str, Dict],
+    overrides: Dict,
+    match: re.Pattern,
+) -> None:
+    """Test that malformed club fields are rejected.
+
+    Each case spreads the overrides into a one-level copy of the shared
+    fixture club, so nested dicts such as clubInfo are shared, not copied.
+    Validation never writes to them, so the session data stays intact.
+    """
+    _, raw = first_club_entry
+
+    with pytest.raises(ValidationError, match=match):
+        _CLUB_DATA_ADAPTER.validate_python({**raw, **overrides})
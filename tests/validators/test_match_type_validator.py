@@ -8,12 +8,14 @@ from ea_nhl_stats.validators.match_type_validator import MatchTypeValidator
 if TYPE_CHECKING:
     from _pytest.fixtures import FixtureRequest
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validator() -> MatchTypeValidator:
-    """Create a MatchTypeValidator instance for testing.
+    """Create a MatchTypeValidator instance shared across the module.
+    
+    Validators are stateless, so one instance serves every parameter.
     
     Returns:
-        MatchTypeValidator: A new instance of MatchTypeValidator.
+        MatchTypeValidator: An instance of MatchTypeValidator.
     """
     return MatchTypeValidator()
 
@@ -45,4 +47,8 @@ def test_validate_invalid_match_type(validator: MatchTypeValidator, match_type:
         validator: The MatchTypeValidator instance to test.
         match_type: The match type identifier to validate.
     """
-    assert validator.validate(match_type) is False 
\ No newline at end of file
+    assert validator.validate(match_type) is False
+
+def test_valid_match_types_is_frozenset() -> None:
+    """Test that the match type whitelist cannot be modified at runtime."""
+    assert isinstance(MatchTypeValidator.VALID_MATCH_TYPES, frozenset)
@@ -8,12 +8,14 @@ from ea_nhl_stats.validators.platform_validator import PlatformValidator
 if TYPE_CHECKING:
     from _pytest.fixtures import FixtureRequest
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validator() -> PlatformValidator:
-    """Create a PlatformValidator instance for testing.
+    """Create a PlatformValidator instance shared across the module.
+    
+    Validators are stateless, so one instance serves every parameter.
     
     Returns:
-        PlatformValidator: A new instance of PlatformValidator.
+        PlatformValidator: An instance of PlatformValidator.
     """
     return PlatformValidator()
 
@@ -47,4 +49,8 @@ def test_validate_invalid_platform(validator: PlatformValidator, platform: str)
         validator: The PlatformValidator instance to test.
         platform: The platform identifier to validate.
     """
-    assert validator.validate(platform) is False 
\ No newline at end of file
+    assert validator.validate(platform) is False
+
+def test_valid_platforms_is_frozenset() -> None:
+    """Test that the platform whitelist is a class-level frozenset."""
+    assert isinstance(PlatformValidator.VALID_PLATFORMS, frozenset)